@@ -0,0 +1,267 @@
+"""
+Physics Kernels Module
+
+This module contains the compiled numeric kernels stepping the physics
+objects' state arrays, collisions with the bars included. They are compiled when the module is imported,
+so the first frame doesn't pay for the compilation.
+"""
+
+import math
+import numpy as np
+from numba import njit, prange, boolean, float32, void
+
+from constants import GRAVITY, FRICTION_COEFFICIENT, OBJECT_ELASTICITY, SLEEP_SPEED
+
+
+# Signature of the kernels' arrays: contiguous float32 buffers, the layout of the engine's state
+_FLOAT32_BUFFER = float32[::1]
+
+# float32 copies of the constants used by the kernels, so their arithmetic isn't promoted to float64.
+# Plain literals count as float64 (or int64) there, and promote whatever they are combined with.
+_ZERO = np.float32(0)
+_ONE = np.float32(1)
+_TWO = np.float32(2)
+_ELASTICITY = np.float32(OBJECT_ELASTICITY)
+_FRICTION = np.float32(FRICTION_COEFFICIENT)
+_FRICTION_DV = np.float32(FRICTION_COEFFICIENT * abs(GRAVITY))  # Floor friction's deceleration
+_SPIN_SCALE = np.float32(360 / math.pi)  # Angular speed = velocity * spin_scale
+_SLEEP_SPEED = np.float32(SLEEP_SPEED)
+_FULL_TURN = np.float32(360)
+_MIN_LENGTH_SQUARED = np.float32(1e-12)  # Below this the collision normal is too short to be normalized
+_TINY_LENGTH = np.float32(1e-30)
+
+
+@njit(fastmath=True, inline="always")
+def _resolve_circle_obb(dx, dy, vel_x, vel_y, angular_speed, radius, spin_scale,
+                        bar_half_width, bar_half_height, cos_angle, sin_angle, elastic):
+    """Resolve the collision of a circle with an oriented rectangle (a bar).
+
+    dx, dy is the vector from the bar's center to the circle's center, and cos_angle, sin_angle the
+    bar's tilt. spin_scale converts the circle's rolling velocity into its angular speed, and the
+    elasticity is applied to the reflected velocity when elastic is set.
+    Return whether they touch, the circle's new velocity and angular speed, and the offset moving the
+    circle out of the bar.
+    """
+    # An untilted bar's local coordinates are the world's, so both transforms are skipped for it
+    axis_aligned = sin_angle == 0 and cos_angle == 1
+
+    # Transform circle position to bar's local coordinates
+    #
+    # Given a vector d = dxi + dyj that is rotated by an 
+    # angle α, it's represented by d' such that: d' = d * Tr
+    #  
+    #         where d' is the rotated vector
+    #               d is the original vector
+    #               Tr is the matrix of rotation
+    #
+    # Tr would then be
+    #                     _             _
+    #                    | Cos(α) -Sin(α)|
+    #               Tr = | Sin(α)  Cos(α)|
+    #                    |_             _|
+
+    if axis_aligned:
+        local_x = dx
+        local_y = dy
+    else:
+        local_x = dx * cos_angle - dy * sin_angle  # Along bar's length
+        local_y = dx * sin_angle + dy * cos_angle  # Perpendicular to bar
+
+    # Find the closest point on the rectangle to the circle's center
+    closest_x = max(-bar_half_width, min(bar_half_width, local_x))
+    closest_y = max(-bar_half_height, min(bar_half_height, local_y))
+
+    # Calculate the collision normal in local space
+    normal_x = local_x - closest_x
+    normal_y = local_y - closest_y
+    length_squared = normal_x * normal_x + normal_y * normal_y
+
+    # The circle doesn't reach the rectangle, compared squared so misses don't need a square root
+    if length_squared > radius * radius:
+        return False, vel_x, vel_y, angular_speed, _ZERO, _ZERO
+    normal_length = math.sqrt(length_squared)
+
+    # Normalize the collision normal, with one division for both components. The tiny offset keeps the
+    # division finite when the circle's center is inside the rectangle, where the normal is replaced below.
+    inverse_length = _ONE / (normal_length + _TINY_LENGTH)
+    normal_x *= inverse_length
+    normal_y *= inverse_length
+
+    # Circle center is inside rectangle, use perpendicular distance to edges. Both candidates are computed
+    # and selected without branching.
+    closer_to_side = abs(local_x) / bar_half_width > abs(local_y) / bar_half_height
+    fallback_x = math.copysign(_ONE, local_x) if closer_to_side else _ZERO  # Closer to left/right edge
+    fallback_y = _ZERO if closer_to_side else math.copysign(_ONE, local_y)  # Closer to top/bottom edge
+    inside = length_squared <= _MIN_LENGTH_SQUARED
+    normal_x = fallback_x if inside else normal_x
+    normal_y = fallback_y if inside else normal_y
+
+    # Transform normal back to world coordinates
+    #
+    # Given a vector d' = dx'i + dy'j that has been rotated by an 
+    # angle α, it's represented by d such that: d = d' * inv(Tr)
+    #  
+    #         where d is the original vector
+    #               d' is the rotated vector
+    #               inv(Tr) is the inverse of the matrix of rotation Tr
+    #
+    # Given that Tr is ortogonal, inv(Tr) would then be its transpose matrix
+    #                          _             _
+    #                         | Cos(α)  Sin(α)|
+    #               inv(Tr) = |-Sin(α)  Cos(α)|
+    #                         |_             _|
+
+    if axis_aligned:
+        world_normal_x = normal_x
+        world_normal_y = normal_y
+    else:
+        world_normal_x = normal_x * cos_angle + normal_y * sin_angle
+        world_normal_y = -normal_x * sin_angle + normal_y * cos_angle
+
+    # Calculate velocity component along the normal (dot product)
+    vel_normal = vel_x * world_normal_x + vel_y * world_normal_y
+
+    # Only resolve collision if objects are moving towards each other
+    if vel_normal < 0:
+        # Apply reflection: v_new = v_old - 2 * (v_old · n) * n
+        new_vel_x = vel_x - _TWO * vel_normal * world_normal_x
+        new_vel_y = vel_y - _TWO * vel_normal * world_normal_y
+        # Update angular speed of object using the cross product between the object's velocity in global coordinates and the normal unitary vector
+        angular_speed = (vel_x * normal_y - vel_y * normal_x) * spin_scale
+
+        # Apply elasticity
+        if elastic:
+            new_vel_x *= _ELASTICITY
+            new_vel_y *= _ELASTICITY
+
+        vel_x = new_vel_x
+        vel_y = new_vel_y
+
+    # Separate the objects to prevent overlap. This doesn't depend on the circle's velocity, since a turning
+    # bar sweeps into circles resting on it.
+    penetration_depth = radius - normal_length
+    shift_x = _ZERO
+    shift_y = _ZERO
+    if penetration_depth > 0:
+        # Move circle out of rectangle
+        shift_x = world_normal_x * penetration_depth
+        shift_y = world_normal_y * penetration_depth
+
+    return True, vel_x, vel_y, angular_speed, shift_x, shift_y
+
+
+# Compiled eagerly for contiguous buffers and without the GIL, so the loop runs as plain native code
+@njit(void(_FLOAT32_BUFFER, _FLOAT32_BUFFER, _FLOAT32_BUFFER, _FLOAT32_BUFFER, _FLOAT32_BUFFER, _FLOAT32_BUFFER, _FLOAT32_BUFFER,
+           _FLOAT32_BUFFER, _FLOAT32_BUFFER, boolean[::1], boolean[::1],
+           _FLOAT32_BUFFER, _FLOAT32_BUFFER, _FLOAT32_BUFFER, _FLOAT32_BUFFER, _FLOAT32_BUFFER, _FLOAT32_BUFFER,
+           _FLOAT32_BUFFER, _FLOAT32_BUFFER, _FLOAT32_BUFFER, float32, float32, float32, float32),
+      cache=True, fastmath=True, parallel=True, nogil=True)
+def step(px, py, vx, vy, ax, hw, hh, va, angle, sleeping, contact,
+         bar_x, bar_y, bar_hw, bar_hh, bar_cos, bar_sin, bar_bound_hw, bar_bound_hh, bar_radius,
+         delta_time, gravity_dt, world_width, world_height):
+    """Advance the physics objects stored in the arrays by one frame.
+
+    Each object (a circle) first collides with the bars, given by their centers, half extents, the
+    cosine and sine of their tilt, the half extents of their tilted bounding box and the radius of their
+    bounding circle. It is then integrated, spun, and bounced off the borders of the window.
+    ax is the objects' own horizontal acceleration, and gravity_dt the velocity change due to gravity
+    over delta_time, shared by all objects.
+    contact tells whether an object touched a bar in the previous frame, and is updated for this one.
+    Objects flagged in sleeping are only integrated once a bar hits them, and objects coming to rest on
+    the floor are flagged.
+    """
+    # Velocity changes over delta_time that are shared by all objects
+    friction = _FRICTION_DV * delta_time
+    wall_friction = _FRICTION * delta_time
+
+    for i in prange(px.shape[0]):
+        # Get distances from borders of object to its center, its width being the circle's diameter
+        half_w = hw[i]
+        half_h = hh[i]
+        # Highest positions the object's center can reach inside the window
+        max_x = world_width - half_w
+        max_y = world_height - half_h
+        # Angular speed of the circle per unit of velocity it rolls with
+        spin_scale = _SPIN_SCALE / half_w
+
+        # Collisions with the bars. The elasticity is only applied when the contact starts.
+        was_touching = contact[i]
+        touching = False
+        for j in range(bar_x.shape[0]):
+            # Vector from bar's center to circle's center
+            dx = px[i] - bar_x[j]
+            dy = py[i] - bar_y[j]
+
+            # Skip the bar when the circle's bounding box doesn't touch the bar's, testing the vertical
+            # axis first since falling objects are usually separated along it
+            if abs(dy) > half_w + bar_bound_hh[j] or abs(dx) > half_w + bar_bound_hw[j]:
+                continue
+            # Then against the bar's bounding circle, which is tighter than the box off the ends of a tilted bar
+            reach = half_w + bar_radius[j]
+            if dx * dx + dy * dy > reach * reach:
+                continue
+
+            touches_bar, vel_x, vel_y, angular_speed, shift_x, shift_y = _resolve_circle_obb(
+                dx, dy, vx[i], vy[i], va[i], half_w, spin_scale, bar_hw[j], bar_hh[j], bar_cos[j], bar_sin[j], not was_touching)
+            if touches_bar:
+                touching = True
+                # Being hit wakes the object up
+                sleeping[i] = False
+                vx[i] = vel_x
+                vy[i] = vel_y
+                va[i] = angular_speed
+                px[i] += shift_x
+                py[i] += shift_y
+        contact[i] = touching
+
+        # Objects at rest are skipped until something wakes them up
+        if sleeping[i]:
+            continue
+
+        # Calculate new velocity and position
+        vel_x = vx[i] + ax[i] * delta_time
+        vel_y = vy[i] + gravity_dt
+        pos_x = px[i] + vel_x * delta_time
+        pos_y = py[i] + vel_y * delta_time
+
+        # Bounce off floor for y direction
+        if pos_y <= half_h:
+            vel_y = -vel_y * _ELASTICITY
+
+            # Update x velocity due to floor's friction, against the direction of motion
+            vel_x -= math.copysign(friction, vel_x)
+
+            # Update angular speed
+            va[i] = vel_x * spin_scale
+
+        # Bounce off walls for x direction
+        if pos_x <= half_w or pos_x >= max_x:
+            vel_x = -vel_x
+
+            # Update y velocity due to wall's friction
+            if vel_y > 0:
+                vel_y -= wall_friction * vel_y
+            else:
+                vel_y += wall_friction * vel_y
+
+            # Update angular speed
+            va[i] = vel_y * spin_scale
+
+        # Clamp to window bounds
+        px[i] = max(half_w, min(max_x, pos_x))
+        py[i] = max(half_h, min(max_y, pos_y))
+
+        # Put the object to sleep once it rests on the floor. Its vertical speed doesn't settle below
+        # one step of gravity, since every step it spends on the floor ends with a small bounce.
+        # Objects pushed horizontally never come to rest.
+        if py[i] <= half_h and abs(vel_y) <= abs(gravity_dt) and abs(vel_x) < _SLEEP_SPEED and ax[i] == _ZERO:
+            sleeping[i] = True
+            vel_x = _ZERO
+            vel_y = _ZERO
+            va[i] = _ZERO
+
+        vx[i] = vel_x
+        vy[i] = vel_y
+
+        # Spin the object, keeping its angle within a turn so float32 doesn't lose precision over time
+        angle[i] = (angle[i] + va[i] * delta_time) % _FULL_TURN
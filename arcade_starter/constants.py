@@ -13,6 +13,9 @@ GRAVITY = -980.0  # pixels/second²
 OBJECT_MASS = 1.0
 OBJECT_ELASTICITY = 0.5
 FRICTION_COEFFICIENT = 0.1
+PHYSICS_TIMESTEP = 1 / 60  # seconds, fixed step of the physics integration
+MAX_PHYSICS_STEPS = 5  # per frame, the remaining time is dropped on slower frames
+SLEEP_SPEED = 1.0  # pixels/second, objects resting on the floor slower than this stop being simulated
 
 # Player/Bar Constants 
 BAR_WIDTH = 700
@@ -21,6 +24,10 @@ BAR_MASS = 1.0
 BAR_SPEED = 400.0
 BAR_POSITION_Y = 200
 
+# Input Constants (bits of the pressed keys mask)
+KEY_CLOCKWISE = 1 << 0
+KEY_COUNTER_CLOCKWISE = 1 << 1
+
 # Display Constants
 WIDTH = 960
 HEIGHT = 540
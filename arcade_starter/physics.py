@@ -8,69 +8,178 @@ for objects in the simulation.
 import arcade
 from typing import Tuple
 import math
+import queue
+import threading
+import weakref
+import numpy as np
 
+from _physics_kernels import step
 from constants import (
     BAR_MASS, BAR_SPEED, OBJECT_MASS, OBJECT_INITIAL_SPEED_X, OBJECT_INITIAL_ANGULAR_SPEED,
-    GRAVITY, FRICTION_COEFFICIENT, OBJECT_ELASTICITY
+    GRAVITY
 )
 
 class PhysicsObject:
     """A physics-enabled object with position, velocity, and collision detection."""
-    
-    def __init__(self, sprite: arcade.Sprite, update_flag: bool = False, mass: float = OBJECT_MASS, velocity_x: float = OBJECT_INITIAL_SPEED_X, acceleration_x: float = 0.0, velocity_y: float = 0.0, acceleration_y: float = GRAVITY, collision_contact: bool = False):
+
+    __slots__ = ("sprite", "mass", "_velocity_x", "_velocity_y", "_acceleration_x", "half_w", "half_h", "_engine", "_index")
+
+    def __init__(self, sprite: arcade.Sprite, mass: float = OBJECT_MASS, velocity_x: float = OBJECT_INITIAL_SPEED_X, acceleration_x: float = 0.0, velocity_y: float = 0.0):
         self.sprite = sprite
-        self.update_flag = update_flag
         self.mass = mass
-        self.velocity_x = velocity_x
-        self.acceleration_x = acceleration_x
-        self.velocity_y = velocity_y
-        self.acceleration_y = acceleration_y
+        # Initial state, copied into the engine's arrays when the object is added
+        self._velocity_x = velocity_x
+        self._velocity_y = velocity_y
+        self._acceleration_x = acceleration_x
+        # Engine holding the object's state and the object's index in its arrays, once added to one
+        self._engine = None
+        self._index = -1
         self.sprite.change_angle = OBJECT_INITIAL_ANGULAR_SPEED
-        self.collision_contact = False # Used to track the contact with another object during a collision
-    
-    def update_physics(self, delta_time: float, world_width: int, world_height: int):
-        """Update physics for this object."""
-        # Get distances from borders of object to its center
-        half_w = self.sprite.width / 2
-        half_h = self.sprite.height / 2
-
-        # Calculate horizontal movement
-        self.velocity_x += self.acceleration_x * delta_time
-        dx = self.velocity_x * delta_time
-        # Calculate vertical movement
-        self.velocity_y += self.acceleration_y * delta_time
-        dy = self.velocity_y * delta_time
-        # Calculate new angle
-        self.sprite.angle += self.sprite.change_angle * delta_time
-
-        # Update position
-        new_x = self.sprite.center_x + dx
-        new_y = self.sprite.center_y + dy
-
-        # Clamp to window bounds
-        self.sprite.center_x = new_x
-        self.sprite.center_y = max(half_h, min(world_height - half_h, new_y))
+        self.refresh_extents()
+
+    def refresh_extents(self):
+        """Cache the sprite's half extents, to be called again only if the sprite is resized."""
+        # Distances from borders of object to its center
+        self.half_w = self.sprite.width * 0.5
+        self.half_h = self.sprite.height * 0.5
+        # The engine steps the object with its own copy of them
+        if self._engine is not None:
+            self._engine.set_extents(self._index, self.half_w, self.half_h)
+
+    @property
+    def velocity_x(self) -> float:
+        """Horizontal velocity, kept in the engine's arrays once the object is added to it."""
+        if self._engine is None:
+            return self._velocity_x
+        return self._engine.get_velocity(self._index)[0]
+
+    @velocity_x.setter
+    def velocity_x(self, value: float):
+        if self._engine is None:
+            self._velocity_x = value
+        else:
+            self._engine.set_velocity(self._index, value, self.velocity_y)
+
+    @property
+    def velocity_y(self) -> float:
+        """Vertical velocity, kept in the engine's arrays once the object is added to it."""
+        if self._engine is None:
+            return self._velocity_y
+        return self._engine.get_velocity(self._index)[1]
+
+    @velocity_y.setter
+    def velocity_y(self, value: float):
+        if self._engine is None:
+            self._velocity_y = value
+        else:
+            self._engine.set_velocity(self._index, self.velocity_x, value)
+
+    @property
+    def acceleration_x(self) -> float:
+        """Horizontal acceleration, on top of gravity, kept in the engine's arrays once the object is added to it."""
+        if self._engine is None:
+            return self._acceleration_x
+        return self._engine.get_acceleration_x(self._index)
+
+    @acceleration_x.setter
+    def acceleration_x(self, value: float):
+        if self._engine is None:
+            self._acceleration_x = value
+        else:
+            self._engine.set_acceleration_x(self._index, value)
+
+    @property
+    def collision_contact(self) -> bool:
+        """Whether the object touched a bar in the last step, tracked by the engine."""
+        if self._engine is None:
+            return False
+        return self._engine.get_contact(self._index)
 
 
 class PlayerController:
     """Handles player input and movement for controllable objects."""
-    
-    def __init__(self, sprite: arcade.Sprite, update_flag: bool = False, mass: float = BAR_MASS, angular_speed: float = BAR_SPEED):
+
+    __slots__ = ("sprite", "mass", "angular_speed", "half_w", "half_h", "bound_half_w", "bound_half_h", "_angle", "bound_radius", "_cos", "_sin", "_bounds_angle")
+
+    def __init__(self, sprite: arcade.Sprite, mass: float = BAR_MASS, angular_speed: float = BAR_SPEED):
         self.sprite = sprite
-        self.update_flag = update_flag
         self.mass = mass
         self.angular_speed = angular_speed
-    
-    def update_movement(self, delta_time: float, keys: set, world_width: int):
-        """Update player-controlled movement."""
-        # Get distances from borders of sprite to its center
-        half_w = self.sprite.width / 2
-        
-        # Player control for sprite's angular speed
-        self.sprite.change_angle = (("clockwise" in keys) - ("counter-clockwise" in keys)) * self.angular_speed
+        # Tilt angle kept as a plain float. Once the controller is added to an engine, the sprite shows the
+        # tilt the last finished step collided against, and the engine writes it.
+        self._angle = sprite.angle
+        self.refresh_extents()
 
+    def refresh_extents(self):
+        """Cache the sprite's half extents, to be called again only if the sprite is resized."""
+        # Distances from borders of sprite to its center
+        self.half_w = self.sprite.width * 0.5
+        self.half_h = self.sprite.height * 0.5
+        # Radius of the circle enclosing the sprite at any tilt
+        self.bound_radius = math.hypot(self.half_w, self.half_h)
+        self._bounds_angle = None  # The bounds depend on the half extents as well
+        self.update_bounds()
+
+    def update_bounds(self):
+        """Update the half extents of the axis-aligned bounding box of the tilted sprite."""
+        # Tilt unchanged since the last call, e.g. the bar wasn't turned, so everything still holds
+        if self._angle == self._bounds_angle:
+            return
+        self._bounds_angle = self._angle
+
+        # Cosine and sine of the tilt, kept for the collisions handled before the bar moves again
+        angle_rad = math.radians(self._angle)
+        self._cos = math.cos(angle_rad)
+        self._sin = math.sin(angle_rad)
+        cos_angle = abs(self._cos)
+        sin_angle = abs(self._sin)
+        half_w = self.half_w
+        half_h = self.half_h
+        self.bound_half_w = half_w * cos_angle + half_h * sin_angle
+        self.bound_half_h = half_w * sin_angle + half_h * cos_angle
+    
+    def update_movement(self, delta_time: float, direction: int, world_width: int):
+        """Update player-controlled movement, spinning clockwise for a direction of 1 and counter-clockwise for -1."""
         # Update bar's new tilt angle
-        self.sprite.angle += self.sprite.change_angle * delta_time
+        if direction:
+            self._angle += direction * self.angular_speed * delta_time
+
+
+def _run_steps(steps: queue.Queue, step_done: threading.Event, step_errors: list):
+    """Run the kernel on the steps submitted by PhysicsEngine.update, one at a time, until None is submitted."""
+    while True:
+        arguments = steps.get()
+        if arguments is None:
+            return
+        try:
+            step(*arguments)
+        except Exception as error:
+            step_errors.append(error)
+        finally:
+            step_done.set()
+
+
+# Fields of the physics objects' state, in the order of the rows of the engine's state block and of the
+# kernel's arguments, each with the value an object starts with. The engine exposes each row as _<field>.
+_STATE_FIELDS = (
+    ("px", lambda obj: obj.sprite.center_x),  # Center position
+    ("py", lambda obj: obj.sprite.center_y),
+    ("vx", lambda obj: obj._velocity_x),  # Velocity
+    ("vy", lambda obj: obj._velocity_y),
+    ("ax", lambda obj: obj._acceleration_x),  # Horizontal acceleration, gravity being shared by all objects
+    ("hw", lambda obj: obj.half_w),  # Distances from borders of object to its center
+    ("hh", lambda obj: obj.half_h),
+    ("va", lambda obj: obj.sprite.change_angle),  # Angular speed
+    ("angle", lambda obj: obj.sprite.angle),  # Angle, in degrees
+)
+# Fields of the flags block, all False for a new object:
+#   sleeping          resting on the floor, skipped by the integration
+#   contact           touching a bar as of the last frame
+_FLAG_FIELDS = ("sleeping", "contact")
+_STATE_ROWS = {name: row for row, (name, _) in enumerate(_STATE_FIELDS)}
+
+# Rows of the engine's state block shown by the sprites: position and angle
+_SPRITE_ROWS = [_STATE_ROWS["px"], _STATE_ROWS["py"], _STATE_ROWS["angle"]]
 
 
 class PhysicsEngine:
@@ -79,220 +188,237 @@ class PhysicsEngine:
     def __init__(self):
         self.physics_objects = []
         self.player_controllers = []
+
+        # State of the physics objects stored as structure of arrays, indexed like self.physics_objects.
+        # The arrays are contiguous rows of two blocks whose capacity doubles when full, one row per field of
+        # _STATE_FIELDS and _FLAG_FIELDS, e.g. _px for the horizontal position.
+        self._state = np.zeros((len(_STATE_FIELDS), 0), dtype=np.float32)
+        self._flags = np.zeros((len(_FLAG_FIELDS), 0), dtype=np.bool_)
+        self._count = 0
+        self._bind_state_arrays()
+        # Objects added since the arrays were last rebuilt
+        self._pending_objects = []
+        # State of the bars handed to the kernel, one contiguous row per field in the kernel's argument order:
+        # center, half extents, cosine and sine of the tilt, half extents of the tilted bounding box, and
+        # radius of the bounding circle
+        self._bars = np.zeros((9, 0), dtype=np.float32)
+
+        # The kernel runs in a background thread, overlapping with the drawing of the frame. It releases the
+        # GIL, and the main thread only touches the arrays again once the step is done.
+        self._steps = queue.Queue()
+        self._step_done = threading.Event()
+        self._step_done.set()
+        self._step_errors = []  # Error raised by the last step, reraised by synchronize
+        self._unsynced = False  # Whether the results of the last step are not snapshotted yet
+        # Positions and angles of the last finished step, written to the sprites when they are drawn.
+        # The bars are drawn at the tilt the step collided against, so both show the same step.
+        self._snapshot = np.zeros((len(_SPRITE_ROWS), 0), dtype=np.float32)
+        self._bar_angles = []  # Tilts of the bars handed to the last step
+        self._bar_snapshot = []
+        self._snapshot_pending = False
+        # The worker doesn't reference the engine, so a dropped engine is collected and stops its worker
+        self._worker = threading.Thread(target=_run_steps, args=(self._steps, self._step_done, self._step_errors),
+                                        name="physics", daemon=True)
+        self._worker.start()
+        self._finalizer = weakref.finalize(self, self._steps.put, None)
+
+    def close(self):
+        """Stop the background worker, once the engine isn't updated anymore."""
+        if self._finalizer.alive:
+            self.synchronize()
+            self._finalizer()
+            self._worker.join()
+
+    def synchronize(self):
+        """Wait for the step running in the background, so the arrays can be used again."""
+        self._step_done.wait()
+        if self._step_errors:
+            raise self._step_errors.pop()
+        if self._unsynced:
+            self._unsynced = False
+            self._take_snapshot()
+
+    def _take_snapshot(self):
+        """Copy the state shown by the sprites, so they can be updated while the next step runs."""
+        self._snapshot = self._state[_SPRITE_ROWS, :self._count]
+        self._bar_snapshot = list(self._bar_angles)
+        self._snapshot_pending = True
+
+    def sync_sprites(self):
+        """Write the state of the last finished step to the sprites, once per frame before drawing them."""
+        if not self._snapshot_pending:
+            return
+        self._snapshot_pending = False
+
+        # A single position assignment updates the hit box and sprite lists once, where separate
+        # center_x/center_y assignments would do it twice
+        pos_x, pos_y, angles = self._snapshot.tolist()
+        for physics_obj, x, y, angle in zip(self.physics_objects, pos_x, pos_y, angles):
+            sprite = physics_obj.sprite
+            sprite.position = (x, y)
+            sprite.angle = angle
+        for controller, angle in zip(self.player_controllers, self._bar_snapshot):
+            if controller.sprite.angle != angle:
+                controller.sprite.angle = angle
+
+    def get_velocity(self, index: int) -> Tuple[float, float]:
+        """Return the velocity of a physics object."""
+        self.synchronize()
+        self._flush_pending_objects()
+        return float(self._vx[index]), float(self._vy[index])
+
+    def set_velocity(self, index: int, velocity_x: float, velocity_y: float):
+        """Set the velocity of a physics object, waking it up."""
+        self.synchronize()
+        self._flush_pending_objects()
+        self._vx[index] = velocity_x
+        self._vy[index] = velocity_y
+        self._sleeping[index] = False
+
+    def get_acceleration_x(self, index: int) -> float:
+        """Return the horizontal acceleration of a physics object."""
+        self.synchronize()
+        self._flush_pending_objects()
+        return float(self._ax[index])
+
+    def set_acceleration_x(self, index: int, acceleration_x: float):
+        """Set the horizontal acceleration of a physics object, waking it up."""
+        self.synchronize()
+        self._flush_pending_objects()
+        self._ax[index] = acceleration_x
+        self._sleeping[index] = False
+
+    def set_extents(self, index: int, half_w: float, half_h: float):
+        """Set the half extents of a physics object, e.g. after its sprite was resized."""
+        self.synchronize()
+        self._flush_pending_objects()
+        self._hw[index] = half_w
+        self._hh[index] = half_h
+
+    def get_contact(self, index: int) -> bool:
+        """Return whether a physics object touched a bar in the last step."""
+        self.synchronize()
+        self._flush_pending_objects()
+        return bool(self._contact[index])
+
+    def _bind_state_arrays(self):
+        """Point the state arrays at the used part of the blocks."""
+        for (name, _), row in zip(_STATE_FIELDS, self._state[:, :self._count]):
+            setattr(self, "_" + name, row)
+        for name, row in zip(_FLAG_FIELDS, self._flags[:, :self._count]):
+            setattr(self, "_" + name, row)
     
     def add_physics_object(self, physics_object: PhysicsObject):
         """Add a physics object to be managed by the engine."""
+        physics_object._engine = self
+        physics_object._index = len(self.physics_objects)
         self.physics_objects.append(physics_object)
+        # The arrays are only grown when needed, so adding many objects copies them once
+        self._pending_objects.append(physics_object)
+
+    def _flush_pending_objects(self):
+        """Append the state of the objects added since the last call to the arrays."""
+        if not self._pending_objects:
+            return
+        pending = self._pending_objects
+        self._pending_objects = []
+        count = self._count
+        new_count = count + len(pending)
+
+        # Grow the blocks to at least twice their capacity, so appending stays amortized constant time
+        if new_count > self._state.shape[1]:
+            capacity = max(new_count, 2 * self._state.shape[1])
+            state = np.zeros((self._state.shape[0], capacity), dtype=np.float32)
+            state[:, :count] = self._state[:, :count]
+            flags = np.zeros((self._flags.shape[0], capacity), dtype=np.bool_)
+            flags[:, :count] = self._flags[:, :count]
+            self._state = state
+            self._flags = flags
+
+        self._state[:, count:new_count] = np.array([
+            [initial_value(obj) for _, initial_value in _STATE_FIELDS]
+            for obj in pending
+        ], dtype=np.float32).T
+        self._flags[:, count:new_count] = False
+        self._count = new_count
+        self._bind_state_arrays()
+    
+    def refresh_extents(self):
+        """Cache the half extents of all sprites again, after some of them were resized."""
+        self.synchronize()
+        self._flush_pending_objects()
+        for physics_obj in self.physics_objects:
+            physics_obj.refresh_extents()
+        for controller in self.player_controllers:
+            controller.refresh_extents()
     
     def add_player_controller(self, player_controller: PlayerController):
         """Add a player controller to be managed by the engine."""
         self.player_controllers.append(player_controller)
+        # The step running in the background may still read the bars
+        self.synchronize()
+        self._bar_angles.append(player_controller._angle)
+        self._bars = np.zeros((self._bars.shape[0], len(self.player_controllers)), dtype=np.float32)
 
-    def handle_sprite_collision(self, delta_time: float, keys: set, world_width: int, world_height: int, physics_obj: PhysicsObject, controller: PlayerController):
-        """Handle collision between a physics object (circle) and a player-controlled object (rectangle)."""
-        
-        # Get the bar's angle in radians
-        bar_angle_rad = math.radians(controller.sprite.angle)
-        cos_angle = math.cos(bar_angle_rad)
-        sin_angle = math.sin(bar_angle_rad)
-
-        # Vector from bar's center to circle's center
-        dx = physics_obj.sprite.center_x - controller.sprite.center_x
-        dy = physics_obj.sprite.center_y - controller.sprite.center_y
-        
-        # Transform circle position to bar's local coordinates
-        #
-        # Given a vector d = dxi + dyj that is rotated by an 
-        # angle α, it's represented by d' such that: d' = d * Tr
-        #  
-        #         where d' is the rotated vector
-        #               d is the original vector
-        #               Tr is the matrix of rotation
-        #
-        # Tr would then be
-        #                     _             _
-        #                    | Cos(α) -Sin(α)|
-        #               Tr = | Sin(α)  Cos(α)|
-        #                    |_             _|
-        
-        local_x = dx * cos_angle - dy * sin_angle  # Along bar's length
-        local_y = dx * sin_angle + dy * cos_angle  # Perpendicular to bar
-
-        # Distance from center to borders of sprites
-        bar_half_width = controller.sprite.width / 2
-        bar_half_height = controller.sprite.height / 2
-        circle_radius = physics_obj.sprite.width / 2
-
-        # Find the closest point on the rectangle to the circle's center
-        closest_x = max(-bar_half_width, min(bar_half_width, local_x))
-        closest_y = max(-bar_half_height, min(bar_half_height, local_y))
-
-        # Calculate the collision normal in local space
-        normal_x = local_x - closest_x
-        normal_y = local_y - closest_y
-        
-        # Normalize the collision normal
-        normal_length = math.sqrt(normal_x * normal_x + normal_y * normal_y)
-        if normal_length > 0:
-            normal_x /= normal_length
-            normal_y /= normal_length
-        else:
-            # Circle center is inside rectangle, use perpendicular distance to edges
-            if abs(local_x) / bar_half_width > abs(local_y) / bar_half_height:
-                # Closer to left/right edge
-                normal_x = 1.0 if local_x > 0 else -1.0
-                normal_y = 0.0
-            else:
-                # Closer to top/bottom edge
-                normal_x = 0.0
-                normal_y = 1.0 if local_y > 0 else -1.0
-
-        # Transform normal back to world coordinates
-        #
-        # Given a vector d' = dx'i + dy'j that has been rotated by an 
-        # angle α, it's represented by d such that: d = d' * inv(Tr)
-        #  
-        #         where d is the original vector
-        #               d' is the rotated vector
-        #               inv(Tr) is the inverse of the matrix of rotation Tr
-        #
-        # Given that Tr is ortogonal, inv(Tr) would then be its transpose matrix
-        #                          _             _
-        #                         | Cos(α)  Sin(α)|
-        #               inv(Tr) = |-Sin(α)  Cos(α)|
-        #                         |_             _|
-
-        world_normal_x = normal_x * cos_angle + normal_y * sin_angle
-        world_normal_y = -normal_x * sin_angle + normal_y * cos_angle
-
-        # Calculate relative velocity
-        vel_x = physics_obj.velocity_x
-        vel_y = physics_obj.velocity_y
-
-        # Calculate velocity component along the normal (dot product)
-        vel_normal = vel_x * world_normal_x + vel_y * world_normal_y
-
-        # Only resolve collision if objects are moving towards each other
-        if vel_normal < 0:
-            # Apply reflection: v_new = v_old - 2 * (v_old · n) * n
-            physics_obj.velocity_x -= 2 * vel_normal * world_normal_x
-            physics_obj.velocity_y -= 2 * vel_normal * world_normal_y
-            # Update angular speed of object using the cross product between the object's velocity in global coordinates and the normal unitary vector  
-            physics_obj.sprite.change_angle = (vel_x * normal_y - vel_y * normal_x) * 360 / (circle_radius * math.pi) # representing the angular speed in radians/seconds
-            
-            # Apply elasticity
-            if self.collision_contact == False:
-                physics_obj.velocity_x *= OBJECT_ELASTICITY
-                physics_obj.velocity_y *= OBJECT_ELASTICITY
-
-        # Update positions of both physics object and controllable object
-        physics_obj.update_physics(delta_time, world_width, world_height)
-        controller.update_movement(delta_time, keys, world_width)
-
-        # Separate the objects to prevent overlap
-        penetration_depth = circle_radius - normal_length
-        if penetration_depth > 0:
-            # Move circle out of rectangle
-            physics_obj.sprite.center_x += world_normal_x * penetration_depth
-            physics_obj.sprite.center_y += world_normal_y * penetration_depth
-
-    def handle_border_collision(self, delta_time: float, world_width: int, world_height: int, sprite):
-        """Handle collision between a sprite and the borders of the window."""
-
-        # Get distances from borders of sprite to its center
-        half_w = sprite.sprite.width / 2
-        half_h = sprite.sprite.height / 2
-        # Get x and y positions of the sprite's center
-        pos_x = sprite.sprite.center_x
-        pos_y = sprite.sprite.center_y
-        # Get the sprite's angle in radians # TBD: For controllable object collisions... later
-        # sprite_angle_rad = math.radians(sprite.sprite.angle)
-        # cos_angle = math.cos(sprite_angle_rad)
-        # sin_angle = math.sin(sprite_angle_rad)
-
-        # Collision between physics sprite and borders
-        if isinstance(sprite, PhysicsObject):
-            # Bounce off floor for y direction
-            if pos_y <= half_h:
-                sprite.velocity_y = -sprite.velocity_y * OBJECT_ELASTICITY
-                pos_y = max(half_h, pos_y)
-
-                # Update x velocity due to floor's friction
-                if (sprite.velocity_x > 0):
-                    sprite.velocity_x -= FRICTION_COEFFICIENT * abs(GRAVITY) * delta_time
-                else:
-                    sprite.velocity_x += FRICTION_COEFFICIENT * abs(GRAVITY) * delta_time
-                
-                # Update angular speed
-                sprite.sprite.change_angle = sprite.velocity_x * 360 / (half_w * math.pi) 
-
-            # Bounce off walls for x direction
-            if pos_x <= half_w or pos_x >= world_width - half_w:
-                sprite.velocity_x = -sprite.velocity_x
-                pos_x = max(half_w, min(world_width - half_w, pos_x))
-
-                # Update y velocity due to wall's friction
-                if (sprite.velocity_y > 0):
-                    sprite.velocity_y -= FRICTION_COEFFICIENT * sprite.velocity_y * delta_time
-                else:
-                    sprite.velocity_y += FRICTION_COEFFICIENT * sprite.velocity_y * delta_time
-                
-                # Update angular speed
-                sprite.sprite.change_angle = sprite.velocity_y * 360 / (half_w * math.pi) 
-            
-            # Clamp to window bounds
-            sprite.sprite.center_x = pos_x
-            sprite.sprite.center_y = max(half_h, min(world_height - half_h, pos_y))
-            
-        # Collision between controllable sprite and borders # TBD: Implement controlled object collisions with window's borders.
-        # elif isinstance(sprite, PlayerController):
-        # sprite.
+    def update(self, delta_time: float, spin_direction: int, world_width: int, world_height: int):
+        """Update all physics objects and player controllers.
 
-    def update(self, delta_time: float, keys: set, world_width: int, world_height: int):
-        """Update all physics objects and player controllers."""
-        # Resetting update flag and handling border collision for physics objects
-        for physics_obj in self.physics_objects:
-            physics_obj.update_flag = False
-            self.handle_border_collision(delta_time, world_width, world_height, physics_obj)
-        
-        # Resetting update flag and handling border collision for player controller object
+        The physics objects are stepped in the background. Their sprites and the bars' show the result once the next
+        update or synchronize call is made, followed by sync_sprites.
+        """
+        self.synchronize()
+        self._flush_pending_objects()
+
+        # The bars' state before they move, which the collisions of this frame are resolved against
+        bars = self._bars
+        for column, controller in enumerate(self.player_controllers):
+            controller.update_bounds()
+            bars[:, column] = (*controller.sprite.position, controller.half_w, controller.half_h,
+                               controller._cos, controller._sin, controller.bound_half_w, controller.bound_half_h,
+                               controller.bound_radius)
+            self._bar_angles[column] = controller._angle
+
+        # Every bar moves once per step
         for controller in self.player_controllers:
-            controller.update_flag = False
-            self.handle_border_collision(delta_time, world_width, world_height, controller)
-        
-        # Check for collisions between physics objects and player controllers using arcade's built-in collision detection
-        for physics_obj in self.physics_objects:
-            for controller in self.player_controllers:
-                if physics_obj.sprite.collides_with_sprite(controller.sprite):
-                    self.handle_sprite_collision(delta_time, keys, world_width, world_height, physics_obj, controller)
-                    self.collision_contact = True
-                    physics_obj.update_flag = True
-                    controller.update_flag = True
-                else:
-                    self.collision_contact = False
-                    if physics_obj.update_flag == False:
-                        physics_obj.update_physics(delta_time, world_width, world_height)
-                        physics_obj.update_flag = True
-                    if controller.update_flag == False:
-                        controller.update_movement(delta_time, keys, world_width)
-                        controller.update_flag = True
+            controller.update_movement(delta_time, spin_direction, world_width)
+        # Collision between controllable sprite and borders # TBD: Implement controlled object collisions with window's borders.
+
+        # Collide all physics objects with the bars, integrate them and handle their collisions with the
+        # borders of the window, in a single pass over the arrays.
+        # Scalars are cast to float32 once here so the kernel never mixes precisions
+        gravity_dt = np.float32(GRAVITY * delta_time)
+        self._step_done.clear()
+        self._unsynced = True
+        self._steps.put((*self._state[:, :self._count], *self._flags[:, :self._count], *bars, np.float32(delta_time), gravity_dt, np.float32(world_width), np.float32(world_height)))
     
     def reset_physics_object(self, index: int, x: float, y: float, velocity_x: float = 0.0, velocity_y: float = 0.0):
         """Reset a physics object to initial state."""
+        self.synchronize()
+        self._flush_pending_objects()
         if 0 <= index < len(self.physics_objects):
             physics_obj = self.physics_objects[index]
-            physics_obj.update_flag = False
-            physics_obj.sprite.center_x = x
-            physics_obj.sprite.center_y = y
-            physics_obj.velocity_x = velocity_x
-            physics_obj.velocity_y = velocity_y
-            physics_obj.sprite.change_angle = OBJECT_INITIAL_ANGULAR_SPEED
+            physics_obj.sprite.position = (x, y)
+            self._px[index] = x
+            self._py[index] = y
+            self._vx[index] = velocity_x
+            self._vy[index] = velocity_y
+            self._va[index] = OBJECT_INITIAL_ANGULAR_SPEED
+            self._sleeping[index] = False
+            self._contact[index] = False
+            self._take_snapshot()
+
+    def wake_physics_objects(self):
+        """Make every physics object resume its simulation, e.g. when the world changed around it."""
+        self.synchronize()
+        self._sleeping[:] = False
     
     def reset_player_controller(self, index: int, x: float, y: float, angle: float = 0.0):
         """Reset a player controller to initial position."""
+        self.synchronize()
         if 0 <= index < len(self.player_controllers):
             controller = self.player_controllers[index]
-            controller.update_flag = False
-            controller.sprite.center_x = x
-            controller.sprite.center_y = y
+            controller.sprite.position = (x, y)
             controller.sprite.angle = angle
+            controller._angle = angle
+            self._bar_angles[index] = angle
+            self._take_snapshot()
@@ -6,26 +6,35 @@ for the particle physics simulation.
 """
 
 import arcade
+import pyglet
+import numpy as np
 import PIL.Image
-import PIL.ImageDraw
-from typing import Set
 from physics import PhysicsEngine, PhysicsObject, PlayerController
-from constants import BALL_RADIUS, OBJECT_INITIAL_SPEED_X, BAR_WIDTH, BAR_HEIGHT, BAR_POSITION_Y
+from constants import PHYSICS_TIMESTEP, MAX_PHYSICS_STEPS, BALL_RADIUS, OBJECT_INITIAL_SPEED_X, BAR_WIDTH, BAR_HEIGHT, BAR_POSITION_Y, KEY_CLOCKWISE, KEY_COUNTER_CLOCKWISE
 
 # Custom method to override SpriteCircle texture with a multiple color one
 def make_multicolor_circle_texture(diameter: int) -> arcade.Texture:
-    # Create transparent image
-    image = PIL.Image.new("RGBA", (diameter, diameter), (0, 0, 0, 0))
-    draw = PIL.ImageDraw.Draw(image)
+    # Distances of the pixel centers to the center of the image, y pointing down
+    radius = diameter / 2
+    yy, xx = np.ogrid[:diameter, :diameter]
+    inside = (xx + 0.5 - radius) ** 2 + (yy + 0.5 - radius) ** 2 <= radius ** 2
+    lower_half = yy >= radius
 
-    # Example: half red, half blue
-    draw.pieslice([0, 0, diameter, diameter], start=0, end=180, fill=(255, 0, 0, 255))
-    draw.pieslice([0, 0, diameter, diameter], start=180, end=360, fill=(255, 255, 255, 255))
+    # Transparent image, example: half red, half white
+    pixels = np.zeros((diameter, diameter, 4), dtype=np.uint8)
+    pixels[inside & lower_half] = (255, 0, 0, 255)
+    pixels[inside & ~lower_half] = (255, 255, 255, 255)
 
-    return arcade.Texture(name="circle", image=image)
+    return arcade.Texture(name="circle", image=PIL.Image.fromarray(pixels, "RGBA"))
 
 class PhysicsSimulation:
     """Handles the physics simulation state and visual representation."""
+
+    # Bar control key -> bit of the pressed keys mask
+    _KEY_BITS = {
+        arcade.key.A: KEY_COUNTER_CLOCKWISE,
+        arcade.key.D: KEY_CLOCKWISE,
+    }
     
     def __init__(self, width: int, height: int):
         self.width = width
@@ -57,8 +66,20 @@ class PhysicsSimulation:
         self.player_controller = PlayerController(self.bar)
         self.physics_engine.add_player_controller(self.player_controller)
         
-        # Track pressed directions for bar control
-        self.keys: Set[str] = set()
+        # Track pressed directions for bar control as a bitmask of KEY_* flags, and the resulting direction
+        # the bar spins in (1 clockwise, -1 counter-clockwise, 0 none), derived when a key changes
+        self.key_mask = 0
+        self.spin_direction = 0
+
+        # Frame time not yet consumed by fixed physics steps
+        self._time_accumulator = 0.0
+
+        # HUD text is laid out once instead of on every draw, and drawn together as one batch
+        self._hud_batch = pyglet.graphics.Batch()
+        controls = "Tilt Counter-Clockwise: A   Tilt Clockwise: D   Reset: R   Fullscreen: F11   Back to Menu: ESC"
+        self._controls_text = arcade.Text(controls, 10, 500, arcade.color.LIGHT_GRAY, 14, batch=self._hud_batch)
+        info = "Blue Ball: Physics-only (bouncing)   Red Bar: Player-controlled"
+        self._info_text = arcade.Text(info, 10, 520, arcade.color.LIGHT_GRAY, 14, batch=self._hud_batch)
     
     def reset(self):
         """Reset the simulation to initial state."""
@@ -74,43 +95,54 @@ class PhysicsSimulation:
         # Reset player-controlled bar using physics engine
         self.physics_engine.reset_player_controller(0, self.width // 2, BAR_POSITION_Y)
         
-        self.keys.clear()
+        self.key_mask = 0
+        self.spin_direction = 0
+        self._time_accumulator = 0.0
     
     def update(self, delta_time: float):
         """Update physics simulation using the physics engine."""
-        # Update all physics objects and player controllers through the physics engine
-        self.physics_engine.update(delta_time, self.keys, self.width, self.height)
+        # Advance the physics in fixed steps, independently of the frame rate
+        self._time_accumulator += delta_time
+        steps = 0
+        while self._time_accumulator >= PHYSICS_TIMESTEP:
+            if steps == MAX_PHYSICS_STEPS:
+                # Too far behind to catch up, drop the backlog instead of slowing down further
+                self._time_accumulator = 0.0
+                break
+            # Update all physics objects and player controllers through the physics engine
+            self.physics_engine.update(PHYSICS_TIMESTEP, self.spin_direction, self.width, self.height)
+            self._time_accumulator -= PHYSICS_TIMESTEP
+            steps += 1
     
     def draw(self):
         """Draw the simulation objects."""
+        # The physics objects' sprites are only updated when they are drawn
+        self.physics_engine.sync_sprites()
         self.object_list.draw()
         self.bar_list.draw()
         
-        # HUD
-        controls = "Tilt Counter-Clockwise: A   Tilt Clockwise: D   Reset: R   Fullscreen: F11   Back to Menu: ESC"
-        arcade.draw_text(controls, 10, 500, arcade.color.LIGHT_GRAY, 14)
-        
-        # Object info
-        info = f"Blue Ball: Physics-only (bouncing)   Red Bar: Player-controlled"
-        arcade.draw_text(info, 10, 520, arcade.color.LIGHT_GRAY, 14)
+        # HUD and object info
+        self._hud_batch.draw()
     
     def handle_key_press(self, symbol: int):
         """Handle key press events for simulation."""
-        if symbol == arcade.key.A:
-            self.keys.add("counter-clockwise")
-        elif symbol == arcade.key.D:
-            self.keys.add("clockwise")
-        elif symbol == arcade.key.R:
+        self.key_mask |= self._KEY_BITS.get(symbol, 0)
+        self._update_spin_direction()
+        if symbol == arcade.key.R:
             self.reset()
     
     def handle_key_release(self, symbol: int):
         """Handle key release events for simulation."""
-        if symbol == arcade.key.A:
-            self.keys.discard("counter-clockwise")
-        elif symbol == arcade.key.D:
-            self.keys.discard("clockwise")
+        self.key_mask &= ~self._KEY_BITS.get(symbol, 0)
+        self._update_spin_direction()
+
+    def _update_spin_direction(self):
+        """Derive the bar's spin direction from the pressed keys, opposite keys cancelling out."""
+        self.spin_direction = bool(self.key_mask & KEY_CLOCKWISE) - bool(self.key_mask & KEY_COUNTER_CLOCKWISE)
     
     def resize(self, width: int, height: int):
         """Handle window resize events."""
         self.width = width
         self.height = height
+        # Resting objects may now be out of the window's bounds
+        self.physics_engine.wake_physics_objects()
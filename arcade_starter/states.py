@@ -0,0 +1,262 @@
+"""
+States Module
+
+This module contains the game states of the application. Each state owns
+its drawing, updating, input handling and cached text, and the main window
+delegates its events to the active state.
+"""
+
+import arcade
+from simulation import PhysicsSimulation
+from constants import WIDTH, HEIGHT, MENU_STATE, SIMULATION_STATE, OPTIONS_STATE
+
+
+class GameState:
+    """Base class for the application states, ignoring every event by default."""
+
+    def __init__(self, app: arcade.Window):
+        self.app = app
+
+    def enter(self):
+        """Called when the state becomes the active one."""
+
+    def needs_draw(self) -> bool:
+        """Return whether the screen has to be redrawn this frame."""
+        return True
+
+    def draw(self):
+        """Draw the state's screen."""
+
+    def update(self, delta_time: float):
+        """Update the state."""
+
+    def on_key_press(self, symbol: int):
+        """Handle key press events."""
+
+    def on_key_release(self, symbol: int):
+        """Handle key release events."""
+
+    def on_mouse_press(self, x: int, y: int, button: int):
+        """Handle mouse click events."""
+
+    def on_resize(self, width: int, height: int):
+        """Handle window resize events."""
+
+    def on_expose(self):
+        """Handle the window having to be drawn again, its content being lost."""
+
+    def toggle_fullscreen(self):
+        """Switch between fullscreen and windowed mode."""
+        self.app.set_fullscreen(not self.app.fullscreen)
+
+    def return_to_menu(self):
+        """Go back to the main menu."""
+        self.app.change_state(MENU_STATE)
+
+    def exit_app(self):
+        """Close the application."""
+        arcade.exit()
+
+
+class StaticScreenState(GameState):
+    """State whose screen only changes on input, so it is redrawn only while dirty."""
+
+    # Symbol -> action table, filled by subclasses
+    _KEY_ACTIONS = {}
+
+    def __init__(self, app: arcade.Window):
+        super().__init__(app)
+        # Two frames are drawn after every change so both buffers of the swap chain hold the new screen
+        self._dirty_frames = 2
+
+    def mark_dirty(self):
+        """Request a redraw of the screen."""
+        self._dirty_frames = 2
+
+    def enter(self):
+        self.mark_dirty()
+
+    def needs_draw(self) -> bool:
+        # Skip drawing when nothing changed since the screen was last drawn
+        if self._dirty_frames == 0:
+            return False
+        self._dirty_frames -= 1
+        return True
+
+    def on_key_press(self, symbol: int):
+        self.mark_dirty()
+        action = self._KEY_ACTIONS.get(symbol)
+        if action is not None:
+            action(self)
+
+    def on_mouse_press(self, x: int, y: int, button: int):
+        self.mark_dirty()
+
+    def on_resize(self, width: int, height: int):
+        self.mark_dirty()
+
+    def on_expose(self):
+        self.mark_dirty()
+
+
+class MenuState(StaticScreenState):
+    """Main menu screen."""
+
+    def __init__(self, app: arcade.Window):
+        super().__init__(app)
+        self.selected_menu_item = 0  # 0=Start, 1=Options, 2=Exit
+
+        # Menu text is laid out once and only recolored when the selection changes
+        self._title_text = arcade.Text("Physics Simulation", WIDTH // 2, HEIGHT - 100,
+                                       arcade.color.WHITE, 48, anchor_x="center")
+        menu_items = ["Start Simulation", "Options", "Exit"]
+        start_y = HEIGHT // 2 + 50
+        self._item_texts = [
+            arcade.Text(item, WIDTH // 2, start_y - (i * 60), arcade.color.WHITE, 24, anchor_x="center")
+            for i, item in enumerate(menu_items)
+        ]
+        self._left_caret_text = arcade.Text(">", WIDTH // 2 - 120, start_y, arcade.color.YELLOW, 24)
+        self._right_caret_text = arcade.Text("<", WIDTH // 2 + 120, start_y, arcade.color.YELLOW, 24)
+        self._instructions_text = arcade.Text("Select: ENTER / click   Fullscreen: F11",
+                                              WIDTH // 2, 50, arcade.color.LIGHT_GRAY, 16, anchor_x="center")
+        self._highlighted_menu_item = None
+
+    def draw(self):
+        """Draw the main menu screen."""
+        # Highlight the selected item and move the selection indicator next to it
+        if self._highlighted_menu_item != self.selected_menu_item:
+            for i, item_text in enumerate(self._item_texts):
+                item_text.color = arcade.color.YELLOW if i == self.selected_menu_item else arcade.color.WHITE
+            y_pos = self._item_texts[self.selected_menu_item].y
+            self._left_caret_text.y = y_pos
+            self._right_caret_text.y = y_pos
+            self._highlighted_menu_item = self.selected_menu_item
+
+        # Title
+        self._title_text.draw()
+
+        # Menu options
+        for item_text in self._item_texts:
+            item_text.draw()
+
+        # Draw selection indicator
+        self._left_caret_text.draw()
+        self._right_caret_text.draw()
+
+        # Instructions
+        self._instructions_text.draw()
+
+    def select_previous_menu_item(self):
+        """Move the menu selection up, wrapping around."""
+        self.selected_menu_item = (self.selected_menu_item - 1) % len(self._item_texts)
+
+    def select_next_menu_item(self):
+        """Move the menu selection down, wrapping around."""
+        self.selected_menu_item = (self.selected_menu_item + 1) % len(self._item_texts)
+
+    def select_menu_item(self):
+        """Execute the currently selected menu item."""
+        if self.selected_menu_item == 0:  # Start Simulation
+            self.app.change_state(SIMULATION_STATE)
+        elif self.selected_menu_item == 1:  # Options
+            self.app.change_state(OPTIONS_STATE)
+        elif self.selected_menu_item == 2:  # Exit
+            self.exit_app()
+
+    def on_mouse_press(self, x: int, y: int, button: int):
+        """Handle mouse click events."""
+        super().on_mouse_press(x, y, button)
+        if button == arcade.MOUSE_BUTTON_LEFT:
+            # Calculate which menu item was clicked
+            for i, item_text in enumerate(self._item_texts):
+                y_pos = item_text.y
+                # Check if click is within the menu item area (approximate)
+                if y_pos - 30 <= y <= y_pos + 30:
+                    self.selected_menu_item = i
+                    self.select_menu_item()
+                    break
+
+    _KEY_ACTIONS = {
+        arcade.key.UP: select_previous_menu_item,
+        arcade.key.W: select_previous_menu_item,
+        arcade.key.DOWN: select_next_menu_item,
+        arcade.key.S: select_next_menu_item,
+        arcade.key.ENTER: select_menu_item,
+        arcade.key.F11: GameState.toggle_fullscreen,
+        arcade.key.ESCAPE: GameState.exit_app,
+    }
+
+
+class OptionsState(StaticScreenState):
+    """Options screen."""
+
+    _KEY_ACTIONS = {
+        arcade.key.F11: GameState.toggle_fullscreen,
+        arcade.key.ESCAPE: GameState.return_to_menu,
+    }
+
+    def __init__(self, app: arcade.Window):
+        super().__init__(app)
+
+        # Options text never changes, so it is laid out once
+        self._title_text = arcade.Text("Options", WIDTH // 2, HEIGHT - 100,
+                                       arcade.color.WHITE, 36, anchor_x="center")
+        self._option_texts = [
+            arcade.Text("Gravity: -980 pixels/second²", WIDTH // 2, HEIGHT // 2 + 50,
+                        arcade.color.WHITE, 20, anchor_x="center"),
+            arcade.Text("Move Speed: 500 pixels/second", WIDTH // 2, HEIGHT // 2,
+                        arcade.color.WHITE, 20, anchor_x="center"),
+            arcade.Text("Update Rate: 120 FPS", WIDTH // 2, HEIGHT // 2 - 50,
+                        arcade.color.WHITE, 20, anchor_x="center"),
+        ]
+        self._instructions_text = arcade.Text("Press ESC to return to menu", WIDTH // 2, 50,
+                                              arcade.color.LIGHT_GRAY, 16, anchor_x="center")
+
+    def draw(self):
+        """Draw the options screen."""
+        # Title
+        self._title_text.draw()
+
+        # Options content
+        for option_text in self._option_texts:
+            option_text.draw()
+
+        # Instructions
+        self._instructions_text.draw()
+
+
+class SimulationState(GameState):
+    """Running physics simulation."""
+
+    _KEY_ACTIONS = {
+        arcade.key.ESCAPE: GameState.return_to_menu,
+        arcade.key.F11: GameState.toggle_fullscreen,
+    }
+
+    def __init__(self, app: arcade.Window, simulation: PhysicsSimulation):
+        super().__init__(app)
+        self.simulation = simulation
+
+    def enter(self):
+        self.simulation.reset()  # Reset simulation state
+
+    def draw(self):
+        self.simulation.draw()
+
+    def update(self, delta_time: float):
+        self.simulation.update(delta_time)
+
+    def on_key_press(self, symbol: int):
+        action = self._KEY_ACTIONS.get(symbol)
+        if action is not None:
+            action(self)
+        else:
+            # Delegate movement keys to simulation
+            self.simulation.handle_key_press(symbol)
+
+    def on_key_release(self, symbol: int):
+        self.simulation.handle_key_release(symbol)
+
+    def on_resize(self, width: int, height: int):
+        # Update simulation dimensions
+        self.simulation.resize(width, height)
@@ -0,0 +1,56 @@
+"""
+Physics Tests
+
+Headless tests of the physics engine, run from the arcade_starter directory with
+python -m unittest discover -s tests
+"""
+
+import unittest
+import arcade
+
+from physics import PhysicsEngine, PhysicsObject, PlayerController
+from constants import BALL_RADIUS, BAR_WIDTH, BAR_HEIGHT, BAR_POSITION_Y, PHYSICS_TIMESTEP
+
+WORLD_WIDTH = 960
+WORLD_HEIGHT = 540
+
+
+class RestingBallTest(unittest.TestCase):
+    """A ball resting on the bar while the bar turns."""
+
+    def setUp(self):
+        self.engine = PhysicsEngine()
+        self.bar = arcade.SpriteSolidColor(BAR_WIDTH, BAR_HEIGHT, WORLD_WIDTH // 2, BAR_POSITION_Y)
+        self.engine.add_player_controller(PlayerController(self.bar))
+        ball = arcade.SpriteCircle(BALL_RADIUS, arcade.color.AZURE_MIST)
+        # Off the bar's center, where turning the bar sweeps its surface into the ball
+        ball.position = (WORLD_WIDTH // 2 + BAR_WIDTH // 10, BAR_POSITION_Y + BAR_HEIGHT / 2 + BALL_RADIUS)
+        self.engine.add_physics_object(PhysicsObject(ball, velocity_x=0.0))
+
+    def tearDown(self):
+        self.engine.close()
+
+    def local_y(self) -> float:
+        """Return the distance of the ball's center from the bar's axis, across the bar.
+
+        The bar is taken as it was in the last step, the one the ball collided with.
+        """
+        self.engine.synchronize()
+        bar_x, bar_y, _, _, cos_angle, sin_angle = self.engine._bars[:6, 0]
+        dx = float(self.engine._px[0]) - bar_x
+        dy = float(self.engine._py[0]) - bar_y
+        return dx * sin_angle + dy * cos_angle
+
+    def test_stays_above_turning_bar(self):
+        # Let the ball settle on the bar
+        for _ in range(60):
+            self.engine.update(PHYSICS_TIMESTEP, 0, WORLD_WIDTH, WORLD_HEIGHT)
+        # Turn the bar counter-clockwise, the way holding A does
+        for _ in range(10):
+            self.engine.update(PHYSICS_TIMESTEP, -1, WORLD_WIDTH, WORLD_HEIGHT)
+            # Within a pixel of the distance at which they touch
+            self.assertGreater(self.local_y(), BAR_HEIGHT / 2 + BALL_RADIUS - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()